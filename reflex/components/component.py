@@ -547,6 +547,20 @@ class Component(BaseComponent, ABC):
     ) -> Dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]:
         """Get the event triggers for the component.
 
+        Returns:
+            The event triggers.
+        """
+        return dict(self._get_declared_event_triggers())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_declared_event_triggers(
+        cls,
+    ) -> Dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]:
+        """Get the default event triggers and those declared as EventHandler fields.
+
+        The result only depends on the class fields, so it is computed once per class.
+
         Returns:
             The event triggers.
         """
@@ -570,7 +584,7 @@ class Component(BaseComponent, ABC):
 
         # Look for component specific triggers,
         # e.g. variable declared as EventHandler types.
-        for field in self.get_fields().values():
+        for field in cls.get_fields().values():
             if types._issubclass(field.outer_type_, EventHandler):
                 args_spec = None
                 annotation = field.annotation
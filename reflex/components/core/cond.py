@@ -10,14 +10,20 @@ from reflex.components.tags import CondTag, Tag
 from reflex.constants import Dirs
 from reflex.style import LIGHT_COLOR_MODE, resolved_color_mode
 from reflex.utils.imports import ImportDict, ImportVar
+from reflex.utils.types import unionize
 from reflex.vars import VarData
 from reflex.vars.base import LiteralVar, Var
-from reflex.vars.number import ternary_operation
 
 _IS_TRUE_IMPORT: ImportDict = {
     f"$/{Dirs.STATE_PATH}": [ImportVar(tag="isTrue")],
 }
 
+# Python conditions that are evaluated at compile time instead of in the browser.
+_CONSTANT_CONDITION_TYPES = (bool, int, type(None))
+
+# Whether the resolved color mode is light, shared by every color_mode_cond.
+_IS_LIGHT_COLOR_MODE = resolved_color_mode == LiteralVar.create(LIGHT_COLOR_MODE)
+
 
 class Cond(MemoizationLeaf):
     """Render one of two components based on a condition."""
@@ -144,6 +150,12 @@ def cond(condition: Any, c1: Any, c2: Any = None) -> Component | Var:
     if isinstance(c1, BaseComponent):
         if c2 is not None and not isinstance(c2, BaseComponent):
             raise ValueError("Both arguments must be components.")
+        if isinstance(condition, _CONSTANT_CONDITION_TYPES):
+            # Only one of the components can ever be rendered.
+            chosen = c1 if condition else c2
+            if isinstance(chosen, Component):
+                return chosen
+            return Fragment.create(chosen) if chosen is not None else Fragment.create()
         return Cond.create(cond_var, c1, c2)
 
     # Otherwise, create a conditional Var.
@@ -153,22 +165,32 @@ def cond(condition: Any, c1: Any, c2: Any = None) -> Component | Var:
     if c2 is None:
         raise ValueError("For conditional vars, the second argument must be set.")
 
-    def create_var(cond_part: Any) -> Var[Any]:
-        return LiteralVar.create(cond_part)
+    if isinstance(condition, _CONSTANT_CONDITION_TYPES):
+        # Only one of the props can ever be used.
+        chosen = c1 if condition else c2
+        return chosen if isinstance(chosen, Var) else LiteralVar.create(chosen)
 
     # convert the truth and false cond parts into vars so the _var_data can be obtained.
-    c1 = create_var(c1)
-    c2 = create_var(c2)
+    # Most cond parts are already vars (e.g. state vars), so skip the conversion for them.
+    c1 = c1 if isinstance(c1, Var) else LiteralVar.create(c1)
+    c2 = c2 if isinstance(c2, Var) else LiteralVar.create(c2)
 
-    # Create the conditional var.
-    return ternary_operation(
-        cond_var.bool()._replace(
-            merge_var_data=VarData(imports=_IS_TRUE_IMPORT),
-        ),
-        c1,
-        c2,
+    cond_var = cond_var.bool()._replace(
+        merge_var_data=VarData(imports=_IS_TRUE_IMPORT),
     )
 
+    # Create the conditional var directly, rather than through the generic
+    # var_operation machinery, since the branches are already vars.
+    return Var(
+        _js_expr=f"({cond_var} ? {c1} : {c2})",
+        _var_type=unionize(c1._var_type, c2._var_type),
+        _var_data=VarData.merge(
+            cond_var._get_all_var_data(),
+            c1._get_all_var_data(),
+            c2._get_all_var_data(),
+        ),
+    ).guess_type()
+
 
 @overload
 def color_mode_cond(light: Component, dark: Component | None = None) -> Component: ...  # pyright: ignore [reportOverlappingOverload]
@@ -189,7 +211,7 @@ def color_mode_cond(light: Any, dark: Any = None) -> Var | Component:
         The conditional component or prop.
     """
     return cond(
-        resolved_color_mode == LiteralVar.create(LIGHT_COLOR_MODE),
+        _IS_LIGHT_COLOR_MODE,
         light,
         dark,
     )
@@ -1,7 +1,8 @@
 """rx.match."""
 
+import json
 import textwrap
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from reflex.components.base import Fragment
 from reflex.components.component import BaseComponent, Component, MemoizationLeaf
@@ -12,6 +13,14 @@ from reflex.utils.exceptions import MatchTypeError
 from reflex.utils.imports import ImportDict
 from reflex.vars import VarData
 from reflex.vars.base import LiteralVar, Var
+from reflex.vars.number import LiteralBooleanVar, LiteralNumberVar
+from reflex.vars.sequence import LiteralStringVar
+
+# The largest integer that JavaScript can represent exactly.
+_MAX_SAFE_INTEGER = 2**53 - 1
+
+# Return values that cannot contain a var expression.
+_PRIMITIVE_LITERAL_VAR_TYPES = (LiteralStringVar, LiteralNumberVar, LiteralBooleanVar)
 
 
 class Match(MemoizationLeaf):
@@ -44,15 +53,15 @@ class Match(MemoizationLeaf):
         cases, default = cls._process_cases(list(cases))
         match_cases = cls._process_match_cases(cases)
 
-        cls._validate_return_types(match_cases)
+        return_type = cls._validate_return_types(match_cases)
 
-        if default is None and types._issubclass(type(match_cases[0][-1]), Var):
+        if default is None and types._issubclass(return_type, Var):
             raise ValueError(
                 "For cases with return types as Vars, a default case must be provided"
             )
 
         return cls._create_match_cond_var_or_component(
-            match_cond_var, match_cases, default
+            match_cond_var, match_cases, default, return_type
         )
 
     @classmethod
@@ -91,8 +100,12 @@ class Match(MemoizationLeaf):
         """
         default = None
 
-        if len([case for case in cases if not isinstance(case, tuple)]) > 1:
-            raise ValueError("rx.match can only have one default case.")
+        has_default = False
+        for case in cases:
+            if not isinstance(case, tuple):
+                if has_default:
+                    raise ValueError("rx.match can only have one default case.")
+                has_default = True
 
         if not cases:
             raise ValueError("rx.match should have at least one case.")
@@ -166,17 +179,20 @@ class Match(MemoizationLeaf):
         return match_cases
 
     @classmethod
-    def _validate_return_types(cls, match_cases: List[List[Var]]) -> None:
+    def _validate_return_types(cls, match_cases: List[List[Var]]) -> Type:
         """Validate that match cases have the same return types.
 
         Args:
             match_cases: The match cases.
 
+        Returns:
+            The common return type of the match cases.
+
         Raises:
             MatchTypeError: If the return types of cases are different.
         """
         first_case_return = match_cases[0][-1]
-        return_type = type(first_case_return)
+        first_case_return_type = return_type = type(first_case_return)
 
         if types._isinstance(first_case_return, BaseComponent):
             return_type = BaseComponent
@@ -184,19 +200,135 @@ class Match(MemoizationLeaf):
             return_type = Var
 
         for index, case in enumerate(match_cases):
-            if not types._issubclass(type(case[-1]), return_type):
+            case_return = case[-1]
+            case_return_type = type(case_return)
+            # Returns of the same type as the first case are always valid.
+            if case_return_type is first_case_return_type:
+                continue
+            if not types._issubclass(case_return_type, return_type):
                 raise MatchTypeError(
                     f"Match cases should have the same return types. Case {index} with return "
-                    f"value `{case[-1]._js_expr if isinstance(case[-1], Var) else textwrap.shorten(str(case[-1]), width=250)}`"
-                    f" of type {type(case[-1])!r} is not {return_type}"
+                    f"value `{case_return._js_expr if isinstance(case_return, Var) else textwrap.shorten(str(case_return), width=250)}`"
+                    f" of type {case_return_type!r} is not {return_type}"
                 )
 
+        return return_type
+
+    @classmethod
+    def _merge_cases_with_same_return(
+        cls, match_cases: List[List[Var]]
+    ) -> List[List[Var]]:
+        """Merge the var match cases that share the same return value.
+
+        Case elements that already appeared in an earlier case can never match,
+        so they are dropped. The remaining elements of a case are merged into the
+        previous case if it has the same return value. When every case element
+        is a primitive literal, no two elements can match the same value, so they
+        are merged into the first case with the same return value instead.
+
+        Args:
+            match_cases: The match cases.
+
+        Returns:
+            The merged match cases.
+        """
+        merged_cases: List[List[Var]] = []
+        case_index_by_return: Dict[Tuple[Any, ...], int] = {}
+        seen_conditions = set()
+        all_literal_conditions = all(
+            cls._get_lookup_key(condition) is not None
+            for case in match_cases
+            for condition in case[:-1]
+        )
+
+        for case in match_cases:
+            conditions = []
+            for condition in case[:-1]:
+                condition_name = str(condition)
+                if condition_name not in seen_conditions:
+                    seen_conditions.add(condition_name)
+                    conditions.append(condition)
+            if not conditions:
+                continue
+
+            return_value = case[-1]
+            return_key = (
+                type(return_value),
+                str(return_value),
+                return_value._get_all_var_data(),
+            )
+            merged_index = case_index_by_return.get(return_key)
+            if merged_index is not None and (
+                all_literal_conditions or merged_index == len(merged_cases) - 1
+            ):
+                merged_cases[merged_index][-1:-1] = conditions
+            else:
+                case_index_by_return[return_key] = len(merged_cases)
+                merged_cases.append([*conditions, return_value])
+
+        return merged_cases
+
+    @classmethod
+    def _get_lookup_key(cls, case_element: Var) -> Optional[str]:
+        """Get the frontend JSON string of a primitive literal case element.
+
+        Args:
+            case_element: The case element.
+
+        Returns:
+            The JSON string the element stringifies to, or None if it is not a primitive literal.
+        """
+        if not isinstance(case_element, LiteralVar):
+            return None
+        value = getattr(case_element, "_var_value", None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            # Large integers lose precision in JavaScript.
+            if abs(value) > _MAX_SAFE_INTEGER:
+                return None
+        elif not isinstance(value, (str, bool)):
+            return None
+        return json.dumps(value, ensure_ascii=False)
+
+    @classmethod
+    def _get_lookup_cases(
+        cls, match_cases: List[List[Var]]
+    ) -> Optional[List[Tuple[str, Var]]]:
+        """Get the cases of a match var that can be compiled to an object lookup.
+
+        This is only possible when every case element and every return value is a
+        primitive literal. The lookup object evaluates all the return values
+        eagerly, which is only safe when none of them can contain a var
+        expression, and a null result then always means no case matched.
+
+        Args:
+            match_cases: The match cases.
+
+        Returns:
+            The (JSON key, return value) pairs, or None if the cases cannot be looked up.
+        """
+        lookup_cases = []
+        seen_keys = set()
+        for case in match_cases:
+            return_value = case[-1]
+            if not isinstance(return_value, _PRIMITIVE_LITERAL_VAR_TYPES):
+                return None
+            for condition in case[:-1]:
+                key = cls._get_lookup_key(condition)
+                if key is None:
+                    return None
+                # Like in a switch statement, the first matching case wins.
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    lookup_cases.append((key, return_value))
+        return lookup_cases
+
     @classmethod
     def _create_match_cond_var_or_component(
         cls,
         match_cond_var: Var,
         match_cases: List[List[Var]],
         default: Optional[Union[Var, BaseComponent]],
+        return_type: Type,
     ) -> Union[Component, Var]:
         """Create and return the match condition var or component.
 
@@ -204,6 +336,7 @@ class Match(MemoizationLeaf):
             match_cond_var: The match condition.
             match_cases: The list of match cases.
             default: The default case.
+            return_type: The common return type of the match cases.
 
         Returns:
             The match component wrapped in a fragment or the match var.
@@ -211,12 +344,9 @@ class Match(MemoizationLeaf):
         Raises:
             ValueError: If the return types are not vars when creating a match var for Var types.
         """
-        if default is None and types._issubclass(
-            type(match_cases[0][-1]), BaseComponent
-        ):
-            default = Fragment.create()
-
-        if types._issubclass(type(match_cases[0][-1]), BaseComponent):
+        if types._issubclass(return_type, BaseComponent):
+            if default is None:
+                default = Fragment.create()
             return Fragment.create(
                 cls(
                     cond=match_cond_var,
@@ -226,18 +356,28 @@ class Match(MemoizationLeaf):
                 )
             )
 
-        # Validate the match cases (as well as the default case) to have Var return types.
-        if any(
-            case for case in match_cases if not types._isinstance(case[-1], Var)
-        ) or not types._isinstance(default, Var):
+        # The match cases were validated to have Var return types, so only the default case is left to check.
+        if not types._isinstance(default, Var):
             raise ValueError("Return types of match cases should be Vars.")
 
-        return Var(
-            _js_expr=format.format_match(
+        match_cases = cls._merge_cases_with_same_return(match_cases)
+
+        lookup_cases = cls._get_lookup_cases(match_cases)
+        if lookup_cases is not None:
+            js_expr = format.format_match_lookup(
+                cond=str(match_cond_var),
+                lookup_cases=lookup_cases,
+                default=default,  # pyright: ignore [reportArgumentType]
+            )
+        else:
+            js_expr = format.format_match(
                 cond=str(match_cond_var),
                 match_cases=match_cases,
                 default=default,  # pyright: ignore [reportArgumentType]
-            ),
+            )
+
+        return Var(
+            _js_expr=js_expr,
             _var_type=default._var_type,  # pyright: ignore [reportAttributeAccessIssue,reportOptionalMemberAccess]
             _var_data=VarData.merge(
                 match_cond_var._get_all_var_data(),
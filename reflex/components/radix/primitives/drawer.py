@@ -4,7 +4,9 @@
 # Style based on https://ui.shadcn.com/docs/components/drawer
 from __future__ import annotations
 
-from typing import Any, List, Literal, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Any, List, Literal, Optional, Union, get_args
 
 from reflex.components.component import Component, ComponentNamespace
 from reflex.components.radix.primitives.base import RadixPrimitiveComponent
@@ -12,7 +14,7 @@ from reflex.components.radix.themes.base import Theme
 from reflex.components.radix.themes.layout.flex import Flex
 from reflex.constants.compiler import MemoizationMode
 from reflex.event import EventHandler, no_args_event_spec, passthrough_event_spec
-from reflex.vars.base import Var
+from reflex.vars.base import LiteralVar, Var
 
 
 class DrawerComponent(RadixPrimitiveComponent):
@@ -25,13 +27,60 @@ class DrawerComponent(RadixPrimitiveComponent):
 
 LiteralDirectionType = Literal["top", "bottom", "left", "right"]
 
+# Shared vars for the literal DrawerRoot prop values, so they are not recreated per drawer.
+_DIRECTION_VARS = {
+    direction: LiteralVar.create(direction)
+    for direction in get_args(LiteralDirectionType)
+}
+_BOOL_VARS = {value: LiteralVar.create(value) for value in (True, False)}
+
+# Base styles set partially based on the source code at https://ui.shadcn.com/docs/components/drawer
+_CONTENT_BASE_STYLE = MappingProxyType(
+    {
+        "left": "0",
+        "right": "0",
+        "bottom": "0",
+        "top": "0",
+        "position": "fixed",
+        "z_index": 50,
+        "display": "flex",
+    }
+)
+
+_OVERLAY_BASE_STYLE = MappingProxyType(
+    {
+        "position": "fixed",
+        "left": "0",
+        "right": "0",
+        "bottom": "0",
+        "top": "0",
+        "z_index": 50,
+        "background": "rgba(0, 0, 0, 0.5)",
+    }
+)
+
+_TITLE_BASE_STYLE = MappingProxyType(
+    {
+        "font-size": "1.125rem",
+        "font-weight": "600",
+        "line-weight": "1",
+        "letter-spacing": "-0.05em",
+    }
+)
+
+_DESCRIPTION_BASE_STYLE = MappingProxyType(
+    {
+        "font-size": "0.875rem",
+    }
+)
+
 
 class DrawerRoot(DrawerComponent):
     """The Root component of a Drawer, contains all parts of a drawer."""
 
     tag = "Drawer.Root"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # The open state of the drawer when it is initially rendered. Use when you do not need to control its open state.
     default_open: Var[bool]
@@ -75,13 +124,33 @@ class DrawerRoot(DrawerComponent):
     # Number between 0 and 1 that determines when the drawer should be closed.
     close_threshold: Var[float]
 
+    @classmethod
+    def create(cls, *children: Any, **props: Any) -> Component:
+        """Create a new DrawerRoot instance.
+
+        Args:
+            *children: The children of the element.
+            **props: The properties of the element.
+
+        Returns:
+            The new DrawerRoot instance.
+        """
+        direction = props.get("direction")
+        if isinstance(direction, str) and direction in _DIRECTION_VARS:
+            props["direction"] = _DIRECTION_VARS[direction]
+        for prop in ("open", "modal"):
+            value = props.get(prop)
+            if isinstance(value, bool):
+                props[prop] = _BOOL_VARS[value]
+        return super().create(*children, **props)
+
 
 class DrawerTrigger(DrawerComponent):
     """The button that opens the dialog."""
 
     tag = "Drawer.Trigger"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # Defaults to true, if the first child acts as the trigger.
     as_child: Var[bool] = Var.create(True)
@@ -111,7 +180,7 @@ class DrawerPortal(DrawerComponent):
 
     tag = "Drawer.Portal"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
 
 # Based on https://www.radix-ui.com/primitives/docs/components/dialog#content
@@ -120,7 +189,7 @@ class DrawerContent(DrawerComponent):
 
     tag = "Drawer.Content"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # Style set partially based on the source code at https://ui.shadcn.com/docs/components/drawer
     def _get_style(self) -> dict:
@@ -129,18 +198,7 @@ class DrawerContent(DrawerComponent):
         Returns:
             The dictionary of the component style as value and the style notation as key.
         """
-        base_style = {
-            "left": "0",
-            "right": "0",
-            "bottom": "0",
-            "top": "0",
-            "position": "fixed",
-            "z_index": 50,
-            "display": "flex",
-        }
-        style = self.style or {}
-        base_style.update(style)
-        return {"css": base_style}
+        return {"css": {**_CONTENT_BASE_STYLE, **(self.style or {})}}
 
     # Fired when the drawer content is opened.
     on_open_auto_focus: EventHandler[no_args_event_spec]
@@ -182,7 +240,7 @@ class DrawerOverlay(DrawerComponent):
 
     tag = "Drawer.Overlay"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # Style set based on the source code at https://ui.shadcn.com/docs/components/drawer
     def _get_style(self) -> dict:
@@ -191,18 +249,7 @@ class DrawerOverlay(DrawerComponent):
         Returns:
             The dictionary of the component style as value and the style notation as key.
         """
-        base_style = {
-            "position": "fixed",
-            "left": "0",
-            "right": "0",
-            "bottom": "0",
-            "top": "0",
-            "z_index": 50,
-            "background": "rgba(0, 0, 0, 0.5)",
-        }
-        style = self.style or {}
-        base_style.update(style)
-        return {"css": base_style}
+        return {"css": {**_OVERLAY_BASE_STYLE, **(self.style or {})}}
 
 
 class DrawerClose(DrawerTrigger):
@@ -210,7 +257,7 @@ class DrawerClose(DrawerTrigger):
 
     tag = "Drawer.Close"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
 
 class DrawerTitle(DrawerComponent):
@@ -218,7 +265,7 @@ class DrawerTitle(DrawerComponent):
 
     tag = "Drawer.Title"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # Style set based on the source code at https://ui.shadcn.com/docs/components/drawer
     def _get_style(self) -> dict:
@@ -227,15 +274,7 @@ class DrawerTitle(DrawerComponent):
         Returns:
             The dictionary of the component style as value and the style notation as key.
         """
-        base_style = {
-            "font-size": "1.125rem",
-            "font-weight": "600",
-            "line-weight": "1",
-            "letter-spacing": "-0.05em",
-        }
-        style = self.style or {}
-        base_style.update(style)
-        return {"css": base_style}
+        return {"css": {**_TITLE_BASE_STYLE, **(self.style or {})}}
 
 
 class DrawerDescription(DrawerComponent):
@@ -243,7 +282,7 @@ class DrawerDescription(DrawerComponent):
 
     tag = "Drawer.Description"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
     # Style set based on the source code at https://ui.shadcn.com/docs/components/drawer
     def _get_style(self) -> dict:
@@ -252,12 +291,7 @@ class DrawerDescription(DrawerComponent):
         Returns:
             The dictionary of the component style as value and the style notation as key.
         """
-        base_style = {
-            "font-size": "0.875rem",
-        }
-        style = self.style or {}
-        base_style.update(style)
-        return {"css": base_style}
+        return {"css": {**_DESCRIPTION_BASE_STYLE, **(self.style or {})}}
 
 
 class DrawerHandle(DrawerComponent):
@@ -265,7 +299,7 @@ class DrawerHandle(DrawerComponent):
 
     tag = "Drawer.Handle"
 
-    alias = "Vaul" + tag
+    alias = sys.intern("Vaul" + tag)
 
 
 class Drawer(ComponentNamespace):
@@ -3,13 +3,14 @@
 # ------------------- DO NOT EDIT ----------------------
 # This file was generated by `reflex/utils/pyi_generator.py`!
 # ------------------------------------------------------
-from typing import Any, Dict, List, Literal, Optional, Union, overload
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Optional, Union, get_args, overload
 
 from reflex.components.component import ComponentNamespace
 from reflex.components.radix.primitives.base import RadixPrimitiveComponent
 from reflex.event import BASE_STATE, EventType
 from reflex.style import Style
-from reflex.vars.base import Var
+from reflex.vars.base import LiteralVar, Var
 
 class DrawerComponent(RadixPrimitiveComponent):
     @overload
@@ -60,6 +61,42 @@ class DrawerComponent(RadixPrimitiveComponent):
         ...
 
 LiteralDirectionType = Literal["top", "bottom", "left", "right"]
+_DIRECTION_VARS = {
+    direction: LiteralVar.create(direction)
+    for direction in get_args(LiteralDirectionType)
+}
+_BOOL_VARS = {value: LiteralVar.create(value) for value in (True, False)}
+_CONTENT_BASE_STYLE = MappingProxyType(
+    {
+        "left": "0",
+        "right": "0",
+        "bottom": "0",
+        "top": "0",
+        "position": "fixed",
+        "z_index": 50,
+        "display": "flex",
+    }
+)
+_OVERLAY_BASE_STYLE = MappingProxyType(
+    {
+        "position": "fixed",
+        "left": "0",
+        "right": "0",
+        "bottom": "0",
+        "top": "0",
+        "z_index": 50,
+        "background": "rgba(0, 0, 0, 0.5)",
+    }
+)
+_TITLE_BASE_STYLE = MappingProxyType(
+    {
+        "font-size": "1.125rem",
+        "font-weight": "600",
+        "line-weight": "1",
+        "letter-spacing": "-0.05em",
+    }
+)
+_DESCRIPTION_BASE_STYLE = MappingProxyType({"font-size": "0.875rem"})
 
 class DrawerRoot(DrawerComponent):
     @overload
@@ -114,10 +151,10 @@ class DrawerRoot(DrawerComponent):
         on_unmount: Optional[EventType[[], BASE_STATE]] = None,
         **props,
     ) -> "DrawerRoot":
-        """Create the component.
+        """Create a new DrawerRoot instance.
 
         Args:
-            *children: The children of the component.
+            *children: The children of the element.
             default_open: The open state of the drawer when it is initially rendered. Use when you do not need to control its open state.
             open: Whether the drawer is open or not.
             on_open_change: Fires when the drawer is opened or closed.
@@ -139,10 +176,10 @@ class DrawerRoot(DrawerComponent):
             class_name: The class name for the component.
             autofocus: Whether the component should take the focus once the page is loaded
             custom_attrs: custom attribute
-            **props: The props of the component.
+            **props: The properties of the element.
 
         Returns:
-            The component.
+            The new DrawerRoot instance.
         """
         ...
 
@@ -600,10 +637,10 @@ class Drawer(ComponentNamespace):
         on_unmount: Optional[EventType[[], BASE_STATE]] = None,
         **props,
     ) -> "DrawerRoot":
-        """Create the component.
+        """Create a new DrawerRoot instance.
 
         Args:
-            *children: The children of the component.
+            *children: The children of the element.
             default_open: The open state of the drawer when it is initially rendered. Use when you do not need to control its open state.
             open: Whether the drawer is open or not.
             on_open_change: Fires when the drawer is opened or closed.
@@ -625,10 +662,10 @@ class Drawer(ComponentNamespace):
             class_name: The class name for the component.
             autofocus: Whether the component should take the focus once the page is loaded
             custom_attrs: custom attribute
-            **props: The props of the component.
+            **props: The properties of the element.
 
         Returns:
-            The component.
+            The new DrawerRoot instance.
         """
         ...
 
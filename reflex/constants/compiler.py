@@ -3,7 +3,8 @@
 import dataclasses
 import enum
 from enum import Enum
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping, Tuple
 
 from reflex.constants import Dirs
 from reflex.utils.imports import ImportVar
@@ -114,11 +115,14 @@ class ComponentName(Enum):
 class Imports(SimpleNamespace):
     """Common sets of import vars."""
 
-    EVENTS = {
-        "react": [ImportVar(tag="useContext")],
-        f"$/{Dirs.CONTEXTS_PATH}": [ImportVar(tag="EventLoopContext")],
-        f"$/{Dirs.STATE_PATH}": [ImportVar(tag=CompileVars.TO_EVENT)],
-    }
+    # Read-only, since it is shared by every component with event triggers.
+    EVENTS: Mapping[str, Tuple[ImportVar, ...]] = MappingProxyType(
+        {
+            "react": (ImportVar(tag="useContext"),),
+            f"$/{Dirs.CONTEXTS_PATH}": (ImportVar(tag="EventLoopContext"),),
+            f"$/{Dirs.STATE_PATH}": (ImportVar(tag=CompileVars.TO_EVENT),),
+        }
+    )
 
 
 class Hooks(SimpleNamespace):
@@ -151,7 +155,7 @@ class MemoizationDisposition(enum.Enum):
     NEVER = "never"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MemoizationMode:
     """The mode for memoizing a Component."""
 
@@ -184,4 +188,10 @@ class SpecialAttributes(enum.Enum):
         Returns:
             True if the attribute is special.
         """
-        return any(attr.startswith(value.value) for value in cls)
+        return attr[:_SPECIAL_ATTRIBUTE_PREFIX_LENGTH] in _SPECIAL_ATTRIBUTE_PREFIXES
+
+
+# All special attribute prefixes have the same length, so checking an attribute
+# only takes a single slice and set lookup.
+_SPECIAL_ATTRIBUTE_PREFIX_LENGTH = len(SpecialAttributes.DATA_UNDERSCORE.value)
+_SPECIAL_ATTRIBUTE_PREFIXES = frozenset(value.value for value in SpecialAttributes)
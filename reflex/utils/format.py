@@ -6,7 +6,7 @@ import inspect
 import json
 import os
 import re
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from reflex import constants
 from reflex.constants.state import FRONTEND_EVENT_STATE
@@ -339,6 +339,28 @@ def format_match(
     return switch_code
 
 
+def format_match_lookup(
+    cond: str | Var,
+    lookup_cases: List[Tuple[str, Var]],
+    default: Var,
+) -> str:
+    """Format a match expression whose cases are all primitive literals as an object lookup.
+
+    Args:
+        cond: The condition.
+        lookup_cases: The list of (JSON key, return value) pairs to match.
+        default: The default case.
+
+    Returns:
+        The formatted match expression.
+    """
+    lookup_code = ", ".join(
+        f"{json.dumps(key)}: ({return_value!s})" for key, return_value in lookup_cases
+    )
+
+    return f"({{{lookup_code}}}[JSON.stringify({cond})] ?? ({default!s}))"
+
+
 def format_prop(
     prop: Union[Var, EventChain, ComponentStyle, str],
 ) -> Union[int, float, str]:
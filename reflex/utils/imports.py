@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import dataclasses
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Tuple, Union
+from typing import DefaultDict, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 
 def merge_imports(
-    *imports: ImportDict | ParsedImportDict | ImmutableParsedImportDict,
+    *imports: Mapping[str, ImportTypes] | ImmutableParsedImportDict,
 ) -> ParsedImportDict:
     """Merge multiple import dicts together.
 
@@ -43,7 +43,7 @@ def merge_imports(
     return all_imports
 
 
-def parse_imports(imports: ImportDict | ParsedImportDict) -> ParsedImportDict:
+def parse_imports(imports: Mapping[str, ImportTypes]) -> ParsedImportDict:
     """Parse the import dict into a standard format.
 
     Args:
@@ -53,7 +53,7 @@ def parse_imports(imports: ImportDict | ParsedImportDict) -> ParsedImportDict:
         The parsed import dict.
     """
 
-    def _make_list(value: ImportTypes) -> list[str | ImportVar] | list[ImportVar]:
+    def _make_list(value: ImportTypes) -> Sequence[str | ImportVar]:
         if isinstance(value, (str, ImportVar)):
             return [value]
         return value
@@ -128,7 +128,9 @@ class ImportVar:
             return self.tag or ""
 
 
-ImportTypes = Union[str, ImportVar, List[Union[str, ImportVar]], List[ImportVar]]
+ImportTypes = Union[
+    str, ImportVar, List[Union[str, ImportVar]], List[ImportVar], Tuple[ImportVar, ...]
+]
 ImportDict = Dict[str, ImportTypes]
 ParsedImportDict = Dict[str, List[ImportVar]]
 ImmutableParsedImportDict = Tuple[Tuple[str, Tuple[ImportVar, ...]], ...]
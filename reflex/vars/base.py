@@ -13,6 +13,7 @@ import re
 import string
 import uuid
 import warnings
+import weakref
 from types import CodeType, FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -56,8 +57,8 @@ from reflex.utils.format import format_state_name
 from reflex.utils.imports import (
     ImmutableParsedImportDict,
     ImportDict,
+    ImportTypes,
     ImportVar,
-    ParsedImportDict,
     parse_imports,
 )
 from reflex.utils.types import (
@@ -101,6 +102,12 @@ class VarSubclassEntry:
 _var_subclasses: List[VarSubclassEntry] = []
 _var_literal_subclasses: List[Tuple[Type[LiteralVar], VarSubclassEntry]] = []
 
+# Cache of the literal var subclass matching a python type. Only matches are
+# cached, since a type can start matching an ABC when it is registered later.
+_var_literal_subclass_by_type: weakref.WeakKeyDictionary[Type, Type[LiteralVar]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 @dataclasses.dataclass(
     eq=True,
@@ -131,7 +138,7 @@ class VarData:
         self,
         state: str = "",
         field_name: str = "",
-        imports: ImportDict | ParsedImportDict | None = None,
+        imports: Mapping[str, ImportTypes] | None = None,
         hooks: Mapping[str, VarData | None] | Sequence[str] | str | None = None,
         deps: list[Var] | None = None,
         position: Hooks.HookPosition | None = None,
@@ -1410,6 +1417,7 @@ class LiteralVar(Var):
                 _var_literal_subclasses.remove(var_literal_subclass)
 
         _var_literal_subclasses.append((cls, var_subclass))
+        _var_literal_subclass_by_type.clear()
 
     @classmethod
     def create(  # pyright: ignore [reportArgumentType]
@@ -1429,21 +1437,40 @@ class LiteralVar(Var):
         Raises:
             TypeError: If the value is not a supported type for LiteralVar.
         """
-        from .object import LiteralObjectVar
-        from .sequence import ArrayVar, LiteralStringVar
-
         if isinstance(value, Var):
             if _var_data is None:
                 return value
             return value._replace(merge_var_data=_var_data)
 
-        for literal_subclass, var_subclass in _var_literal_subclasses[::-1]:
-            if isinstance(value, var_subclass.python_types):
-                return literal_subclass.create(value, _var_data=_var_data)
+        value_type = type(value)
+        # Proxies report the class of the wrapped value, which isinstance follows,
+        # so only cache the values whose class is their actual type.
+        cacheable = value.__class__ is value_type
+        literal_subclass = (
+            _var_literal_subclass_by_type.get(value_type) if cacheable else None
+        )
+        if literal_subclass is None:
+            literal_subclass = next(
+                (
+                    literal_subclass
+                    for literal_subclass, var_subclass in reversed(
+                        _var_literal_subclasses
+                    )
+                    if isinstance(value, var_subclass.python_types)
+                ),
+                None,
+            )
+            if literal_subclass is not None and cacheable:
+                _var_literal_subclass_by_type[value_type] = literal_subclass
+        if literal_subclass is not None:
+            return literal_subclass.create(value, _var_data=_var_data)
 
         from reflex.event import EventHandler
         from reflex.utils.format import get_event_handler_parts
 
+        from .object import LiteralObjectVar
+        from .sequence import ArrayVar, LiteralStringVar
+
         if isinstance(value, EventHandler):
             return Var(_js_expr=".".join(filter(None, get_event_handler_parts(value))))
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
-import sys
+import functools
 from typing import Any, Callable, Optional, Sequence, Tuple, Type, Union, overload
 
 from typing_extensions import Concatenate, Generic, ParamSpec, Protocol, TypeVar
@@ -23,6 +23,10 @@ V6 = TypeVar("V6")
 R = TypeVar("R")
 
 
+# The rest arguments forwarded by partially applied functions.
+_REST_ARGS_VAR = Var(_js_expr="...args")
+
+
 class ReflexCallable(Protocol[P, R]):
     """Protocol for a callable."""
 
@@ -38,6 +42,19 @@ OTHER_CALLABLE_TYPE = TypeVar(
 class FunctionVar(Var[CALLABLE_TYPE], default_type=ReflexCallable[Any, Any]):
     """Base class for immutable function vars."""
 
+    @cached_property_no_lock
+    def _return_type(self) -> GenericType:
+        """The return type of the function.
+
+        Returns:
+            The return type of the function, or Any if it is unknown.
+        """
+        return (
+            self._var_type.__args__[1]
+            if getattr(self._var_type, "__args__", None)
+            else Any
+        )
+
     @overload
     def partial(self) -> FunctionVar[CALLABLE_TYPE]: ...
 
@@ -113,7 +130,7 @@ class FunctionVar(Var[CALLABLE_TYPE], default_type=ReflexCallable[Any, Any]):
             return ArgsFunctionOperation.create((), self)
         return ArgsFunctionOperation.create(
             ("...args",),
-            VarOperationCall.create(self, *args, Var(_js_expr="...args")),
+            VarOperationCall.create(self, *args, _REST_ARGS_VAR),
         )
 
     @overload
@@ -216,11 +233,9 @@ class FunctionStringVar(FunctionVar[CALLABLE_TYPE]):
         Returns:
             The function var.
         """
-        return FunctionStringVar(
-            _js_expr=func,
-            _var_type=_var_type,
-            _var_data=_var_data,
-        )
+        # Pass the Var fields (_js_expr, _var_type, _var_data) positionally,
+        # which binds faster than keywords.
+        return FunctionStringVar(func, _var_type, _var_data)
 
 
 @dataclasses.dataclass(
@@ -234,6 +249,15 @@ class VarOperationCall(Generic[P, R], CachedVarOperation, Var[R]):
     _func: Optional[FunctionVar[ReflexCallable[P, R]]] = dataclasses.field(default=None)
     _args: Tuple[Union[Var, Any], ...] = dataclasses.field(default_factory=tuple)
 
+    @cached_property_no_lock
+    def _literal_args(self) -> Tuple[Var, ...]:
+        """The arguments converted to vars.
+
+        Returns:
+            The arguments as vars.
+        """
+        return tuple(LiteralVar.create(arg) for arg in self._args)
+
     @cached_property_no_lock
     def _cached_var_name(self) -> str:
         """The name of the var.
@@ -241,7 +265,10 @@ class VarOperationCall(Generic[P, R], CachedVarOperation, Var[R]):
         Returns:
             The name of the var.
         """
-        return f"({self._func!s}({', '.join([str(LiteralVar.create(arg)) for arg in self._args])}))"
+        func = "" if self._func is None else str(self._func)
+        if not self._args:
+            return f"({func}())"
+        return f"({func}({', '.join(map(str, self._literal_args))}))"
 
     @cached_property_no_lock
     def _cached_get_all_var_data(self) -> VarData | None:
@@ -252,7 +279,7 @@ class VarOperationCall(Generic[P, R], CachedVarOperation, Var[R]):
         """
         return VarData.merge(
             self._func._get_all_var_data() if self._func is not None else None,
-            *[LiteralVar.create(arg)._get_all_var_data() for arg in self._args],
+            *[arg._get_all_var_data() for arg in self._literal_args],
             self._var_data,
         )
 
@@ -275,15 +302,11 @@ class VarOperationCall(Generic[P, R], CachedVarOperation, Var[R]):
         Returns:
             The function call var.
         """
-        function_return_type = (
-            func._var_type.__args__[1]
-            if getattr(func._var_type, "__args__", None)
-            else Any
-        )
-        var_type = _var_type if _var_type is not Any else function_return_type
+        if _var_type is Any:
+            _var_type = func._return_type
         return cls(
             _js_expr="",
-            _var_type=var_type,
+            _var_type=_var_type,
             _var_data=_var_data,
             _func=func,
             _args=args,
@@ -297,8 +320,9 @@ class DestructuredArg:
     fields: Tuple[str, ...] = ()
     rest: Optional[str] = None
 
-    def to_javascript(self) -> str:
-        """Convert the destructured argument to JavaScript.
+    @cached_property_no_lock
+    def _javascript(self) -> str:
+        """The destructured argument in JavaScript.
 
         Returns:
             The destructured argument in JavaScript.
@@ -309,6 +333,14 @@ class DestructuredArg:
             "}",
         )
 
+    def to_javascript(self) -> str:
+        """Convert the destructured argument to JavaScript.
+
+        Returns:
+            The destructured argument in JavaScript.
+        """
+        return self._javascript
+
 
 @dataclasses.dataclass(
     frozen=True,
@@ -319,6 +351,65 @@ class FunctionArgs:
     args: Tuple[Union[str, DestructuredArg], ...] = ()
     rest: Optional[str] = None
 
+    @cached_property_no_lock
+    def _javascript(self) -> str:
+        """The argument list in JavaScript.
+
+        Returns:
+            The argument list in JavaScript.
+        """
+        args = ", ".join(
+            arg if isinstance(arg, str) else arg.to_javascript() for arg in self.args
+        )
+        if self.rest:
+            return f"{args}, ...{self.rest}" if args else f"...{self.rest}"
+        return args
+
+    def to_javascript(self) -> str:
+        """Convert the function arguments to JavaScript.
+
+        Returns:
+            The argument list in JavaScript, without the parentheses.
+        """
+        return self._javascript
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_function_args(
+    args: Tuple[Union[str, DestructuredArg], ...], rest: Optional[str]
+) -> FunctionArgs:
+    """Get a FunctionArgs instance shared by every function with the same arguments.
+
+    Args:
+        args: The names of the arguments.
+        rest: The name of the rest argument.
+
+    Returns:
+        The function arguments.
+    """
+    return FunctionArgs(args=args, rest=rest)
+
+
+def _create_function_args(
+    args_names: Sequence[Union[str, DestructuredArg]], rest: Optional[str]
+) -> FunctionArgs:
+    """Create the function arguments, sharing the instance when possible.
+
+    Args:
+        args_names: The names of the arguments.
+        rest: The name of the rest argument.
+
+    Returns:
+        The function arguments.
+    """
+    # Most callers already pass a tuple, which does not need to be copied.
+    args = args_names if type(args_names) is tuple else tuple(args_names)
+    try:
+        return _get_function_args(args, rest)
+    except TypeError:
+        # Destructured arguments with unhashable fields cannot be shared.
+        return FunctionArgs(args=args, rest=rest)
+
 
 def format_args_function_operation(
     args: FunctionArgs, return_expr: Var | Any, explicit_return: bool
@@ -333,31 +424,26 @@ def format_args_function_operation(
     Returns:
         The formatted args function operation.
     """
-    arg_names_str = ", ".join(
-        [arg if isinstance(arg, str) else arg.to_javascript() for arg in args.args]
-    ) + (f", ...{args.rest}" if args.rest else "")
-
-    return_expr_str = str(LiteralVar.create(return_expr))
+    return_expr_str = (
+        str(return_expr)
+        if isinstance(return_expr, Var)
+        else str(LiteralVar.create(return_expr))
+    )
 
     # Wrap return expression in curly braces if explicit return syntax is used.
     return_expr_str_wrapped = (
         format.wrap(return_expr_str, "{", "}") if explicit_return else return_expr_str
     )
 
-    return f"(({arg_names_str}) => {return_expr_str_wrapped})"
+    return f"(({args.to_javascript()}) => {return_expr_str_wrapped})"
 
 
-@dataclasses.dataclass(
-    eq=False,
-    frozen=True,
-    slots=True,
-)
-class ArgsFunctionOperation(CachedVarOperation, FunctionVar):
-    """Base class for immutable function defined via arguments and return expression."""
+class _ArgsFunctionOperationMixin:
+    """Shared name formatting of the function vars defined via arguments and return expression."""
 
-    _args: FunctionArgs = dataclasses.field(default_factory=FunctionArgs)
-    _return_expr: Union[Var, Any] = dataclasses.field(default=None)
-    _explicit_return: bool = dataclasses.field(default=False)
+    _args: FunctionArgs
+    _return_expr: Union[Var, Any]
+    _explicit_return: bool
 
     @cached_property_no_lock
     def _cached_var_name(self) -> str:
@@ -370,6 +456,21 @@ class ArgsFunctionOperation(CachedVarOperation, FunctionVar):
             self._args, self._return_expr, self._explicit_return
         )
 
+
+@dataclasses.dataclass(
+    eq=False,
+    frozen=True,
+    slots=True,
+)
+class ArgsFunctionOperation(
+    _ArgsFunctionOperationMixin, CachedVarOperation, FunctionVar
+):
+    """Base class for immutable function defined via arguments and return expression."""
+
+    _args: FunctionArgs = dataclasses.field(default_factory=FunctionArgs)
+    _return_expr: Union[Var, Any] = dataclasses.field(default=None)
+    _explicit_return: bool = dataclasses.field(default=False)
+
     @classmethod
     def create(
         cls,
@@ -398,7 +499,7 @@ class ArgsFunctionOperation(CachedVarOperation, FunctionVar):
             _js_expr="",
             _var_type=_var_type,
             _var_data=_var_data,
-            _args=FunctionArgs(args=tuple(args_names), rest=rest),
+            _args=_create_function_args(args_names, rest),
             _return_expr=return_expr,
             _explicit_return=explicit_return,
         )
@@ -409,24 +510,15 @@ class ArgsFunctionOperation(CachedVarOperation, FunctionVar):
     frozen=True,
     slots=True,
 )
-class ArgsFunctionOperationBuilder(CachedVarOperation, BuilderFunctionVar):
+class ArgsFunctionOperationBuilder(
+    _ArgsFunctionOperationMixin, CachedVarOperation, BuilderFunctionVar
+):
     """Base class for immutable function defined via arguments and return expression with the builder pattern."""
 
     _args: FunctionArgs = dataclasses.field(default_factory=FunctionArgs)
     _return_expr: Union[Var, Any] = dataclasses.field(default=None)
     _explicit_return: bool = dataclasses.field(default=False)
 
-    @cached_property_no_lock
-    def _cached_var_name(self) -> str:
-        """The name of the var.
-
-        Returns:
-            The name of the var.
-        """
-        return format_args_function_operation(
-            self._args, self._return_expr, self._explicit_return
-        )
-
     @classmethod
     def create(
         cls,
@@ -455,31 +547,19 @@ class ArgsFunctionOperationBuilder(CachedVarOperation, BuilderFunctionVar):
             _js_expr="",
             _var_type=_var_type,
             _var_data=_var_data,
-            _args=FunctionArgs(args=tuple(args_names), rest=rest),
+            _args=_create_function_args(args_names, rest),
             _return_expr=return_expr,
             _explicit_return=explicit_return,
         )
 
 
-if python_version := sys.version_info[:2] >= (3, 10):
-    JSON_STRINGIFY = FunctionStringVar.create(
-        "JSON.stringify", _var_type=ReflexCallable[[Any], str]
-    )
-    ARRAY_ISARRAY = FunctionStringVar.create(
-        "Array.isArray", _var_type=ReflexCallable[[Any], bool]
-    )
-    PROTOTYPE_TO_STRING = FunctionStringVar.create(
-        "((__to_string) => __to_string.toString())",
-        _var_type=ReflexCallable[[Any], str],
-    )
-else:
-    JSON_STRINGIFY = FunctionStringVar.create(
-        "JSON.stringify", _var_type=ReflexCallable[Any, str]
-    )
-    ARRAY_ISARRAY = FunctionStringVar.create(
-        "Array.isArray", _var_type=ReflexCallable[Any, bool]
-    )
-    PROTOTYPE_TO_STRING = FunctionStringVar.create(
-        "((__to_string) => __to_string.toString())",
-        _var_type=ReflexCallable[Any, str],
-    )
+JSON_STRINGIFY = FunctionStringVar.create(
+    "JSON.stringify", _var_type=ReflexCallable[[Any], str]
+)
+ARRAY_ISARRAY = FunctionStringVar.create(
+    "Array.isArray", _var_type=ReflexCallable[[Any], bool]
+)
+PROTOTYPE_TO_STRING = FunctionStringVar.create(
+    "((__to_string) => __to_string.toString())",
+    _var_type=ReflexCallable[[Any], str],
+)
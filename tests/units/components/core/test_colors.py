@@ -77,11 +77,15 @@ def test_color(color, expected, expected_type: Union[Type[str], Type[Color]]):
     "cond_var, expected",
     [
         (
-            rx.cond(True, rx.color("mint"), rx.color("tomato", 5)),
+            rx.cond(LiteralVar.create(True), rx.color("mint"), rx.color("tomato", 5)),
             '(true ? "var(--mint-7)" : "var(--tomato-5)")',
         ),
         (
-            rx.cond(True, rx.color(ColorState.color), rx.color(ColorState.color, 5)),  # pyright: ignore [reportArgumentType, reportCallIssue]
+            rx.cond(
+                LiteralVar.create(True),
+                rx.color(ColorState.color),
+                rx.color(ColorState.color, 5),
+            ),  # pyright: ignore [reportArgumentType, reportCallIssue]
             f'(true ? ("var(--"+{color_state_name!s}.color+"-7)") : ("var(--"+{color_state_name!s}.color+"-5)"))',
         ),
         (
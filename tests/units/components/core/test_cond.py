@@ -8,7 +8,8 @@ from reflex.components.core.cond import Cond, cond
 from reflex.components.radix.themes.typography.text import Text
 from reflex.state import BaseState
 from reflex.utils.format import format_state_name
-from reflex.vars.base import LiteralVar, Var, computed_var
+from reflex.vars.base import LiteralVar, Var, VarData, computed_var
+from reflex.vars.sequence import StringVar
 
 
 @pytest.fixture
@@ -21,7 +22,7 @@ def cond_state(request):
 
 def test_f_string_cond_interpolation():
     # make sure backticks inside interpolation don't get escaped
-    var = LiteralVar.create(f"x {cond(True, 'a', 'b')}")
+    var = LiteralVar.create(f"x {cond(LiteralVar.create(True), 'a', 'b')}")
     assert str(var) == '("x "+(true ? "a" : "b"))'
 
 
@@ -86,7 +87,7 @@ def test_prop_cond(c1: Any, c2: Any):
         c2: false condition value
     """
     prop_cond = cond(
-        True,
+        LiteralVar.create(True),
         c1,
         c2,
     )
@@ -108,7 +109,7 @@ def test_cond_no_mix():
 def test_cond_no_else():
     """Test if cond can be used without else."""
     # Components should support the use of cond without else
-    comp = cond(True, Text.create("hello"))
+    comp = cond(LiteralVar.create(True), Text.create("hello"))
     assert isinstance(comp, Fragment)
     comp = comp.children[0]
     assert isinstance(comp, Cond)
@@ -121,6 +122,27 @@ def test_cond_no_else():
         cond(True, "hello")  # pyright: ignore [reportArgumentType]
 
 
+def test_cond_constant_condition():
+    """Test that cond with a Python constant condition returns the reachable branch."""
+    hello = Text.create("hello")
+    world = Text.create("world")
+    assert cond(True, hello, world) is hello
+    assert cond(0, hello, world) is world
+    assert cond(None, hello) == Fragment.create()
+
+    a = LiteralVar.create("a")
+    assert cond(1, a, "b") is a
+    prop_cond = cond(False, a, "b")
+    assert isinstance(prop_cond, Var)
+    assert str(prop_cond) == '"b"'
+
+    # The arguments are still validated.
+    with pytest.raises(ValueError):
+        cond(False, LiteralVar.create("hello"), world)
+    with pytest.raises(ValueError):
+        cond(True, "hello")  # pyright: ignore [reportArgumentType]
+
+
 def test_cond_computed_var():
     """Test if cond works with computed vars."""
 
@@ -133,7 +155,11 @@ def test_cond_computed_var():
         def computed_str(self) -> str:
             return "a string"
 
-    comp = cond(True, CondStateComputed.computed_int, CondStateComputed.computed_str)
+    comp = cond(
+        LiteralVar.create(True),
+        CondStateComputed.computed_int,
+        CondStateComputed.computed_str,
+    )
 
     # TODO: shouldn't this be a ComputedVar?
     assert isinstance(comp, Var)
@@ -144,3 +170,30 @@ def test_cond_computed_var():
     )
 
     assert comp._var_type == Union[int, str]
+
+
+def test_prop_cond_var_data():
+    """Test that a prop cond keeps the var data of the condition and branches."""
+    condition = Var(
+        _js_expr="condition",
+        _var_type=bool,
+        _var_data=VarData(hooks={"const condition = true;": None}),
+    )
+    branch = Var(
+        _js_expr="branch",
+        _var_type=str,
+        _var_data=VarData(hooks={"const branch = 'a';": None}),
+    )
+
+    prop_cond = cond(condition, branch, "b")
+
+    assert isinstance(prop_cond, StringVar)
+    assert str(prop_cond) == '(isTrue(condition) ? branch : "b")'
+    var_data = prop_cond._get_all_var_data()
+    assert var_data is not None
+    assert set(var_data.hooks) == {"const condition = true;", "const branch = 'a';"}
+    assert any(
+        import_var.tag == "isTrue"
+        for _, import_vars in var_data.imports
+        for import_var in import_vars
+    )
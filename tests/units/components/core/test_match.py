@@ -142,6 +142,112 @@ def test_match_vars(cases, expected):
     assert str(match_comp) == expected
 
 
+@pytest.mark.parametrize(
+    "cases, expected",
+    [
+        (
+            (
+                (1, "first"),
+                (2, 3, "second value"),
+                ("random", True, "third value"),
+                (2, "unreachable"),
+                "default value",
+            ),
+            '({"1": ("first"), "2": ("second value"), "3": ("second value"), '
+            '"\\"random\\"": ("third value"), "true": ("third value")}'
+            f'[JSON.stringify({MatchState.get_name()}.value)] ?? ("default value"))',
+        ),
+        (
+            (
+                ("é", "accent"),
+                MatchState.string,
+            ),
+            '({"\\"\\u00e9\\"": ("accent")}'
+            f"[JSON.stringify({MatchState.get_name()}.value)] ?? ({MatchState.get_name()}.string))",
+        ),
+        (
+            (
+                (1, MatchState.num),
+                MatchState.num + 1,
+            ),
+            f"(() => {{ switch (JSON.stringify({MatchState.get_name()}.value)) {{"
+            f"case JSON.stringify(1):  return ({MatchState.get_name()}.num);  break;"
+            f"default:  return (({MatchState.get_name()}.num + 1));  break;}};}})()",
+        ),
+        (
+            (
+                ("user", {"label": MatchState.string.upper()}),
+                ("first", ["a"]),
+                {"label": "none"},
+            ),
+            f"(() => {{ switch (JSON.stringify({MatchState.get_name()}.value)) {{"
+            f'case JSON.stringify("user"):  return (({{ ["label"] : {MatchState.get_name()}.string.toUpperCase() }}));  break;'
+            'case JSON.stringify("first"):  return (["a"]);  break;'
+            'default:  return (({ ["label"] : "none" }));  break;};})()',
+        ),
+        (
+            (
+                (2**53, "big"),
+                "default value",
+            ),
+            f"(() => {{ switch (JSON.stringify({MatchState.get_name()}.value)) {{"
+            'case JSON.stringify(9007199254740992):  return ("big");  break;'
+            'default:  return ("default value");  break;};})()',
+        ),
+    ],
+)
+def test_match_vars_lookup(cases, expected):
+    """Test that matching primitive literal cases compiles to an object lookup.
+
+    Args:
+        cases: The match cases.
+        expected: The expected var full name.
+    """
+    match_comp = Match.create(MatchState.value, *cases)
+    assert isinstance(match_comp, Var)
+    assert str(match_comp) == expected
+
+
+def test_match_vars_merge_same_return():
+    """Test that var match cases sharing a return value are merged."""
+    state_name = MatchState.get_name()
+
+    # Non-literal cases are only merged with the previous case.
+    match_comp = Match.create(
+        MatchState.value,
+        (MatchState.num, "first"),
+        (MatchState.num + 1, "first"),
+        ([1, 2], "second"),
+        (MatchState.num + 2, "first"),
+        (MatchState.num, [1, 2], "unreachable"),
+        "default value",
+    )
+    assert isinstance(match_comp, Var)
+    assert str(match_comp) == (
+        f"(() => {{ switch (JSON.stringify({state_name}.value)) {{"
+        f"case JSON.stringify({state_name}.num): case JSON.stringify(({state_name}.num + 1)):  "
+        'return ("first");  break;case JSON.stringify([1, 2]):  return ("second");  break;'
+        f'case JSON.stringify(({state_name}.num + 2)):  return ("first");  break;'
+        'default:  return ("default value");  break;};})()'
+    )
+
+    # Primitive literal cases are merged with the first case with the same return.
+    match_comp = Match.create(
+        MatchState.value,
+        (1, MatchState.string),
+        (2, "second"),
+        (3, MatchState.string),
+        "default value",
+    )
+    assert isinstance(match_comp, Var)
+    assert str(match_comp) == (
+        f"(() => {{ switch (JSON.stringify({state_name}.value)) {{"
+        f"case JSON.stringify(1): case JSON.stringify(3):  return ({state_name}.string);  break;"
+        'case JSON.stringify(2):  return ("second");  break;'
+        'default:  return ("default value");  break;};})()'
+    )
+
+
 def test_match_on_component_without_default():
     """Test that matching cases with return values as components returns a Fragment
     as the default case if not provided.
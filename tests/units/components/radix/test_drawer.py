@@ -0,0 +1,20 @@
+import pytest
+
+from reflex.components.radix.primitives.drawer import DrawerRoot
+
+
+def test_drawer_root_literal_props():
+    """Test that literal DrawerRoot props render and are still validated."""
+    first = DrawerRoot.create(direction="left", open=True, modal=False)
+    second = DrawerRoot.create(direction="left", open=True)
+
+    assert first.render()["props"] == [
+        'direction={"left"}',
+        "modal={false}",
+        "open={true}",
+    ]
+    assert first.direction is second.direction  # pyright: ignore [reportAttributeAccessIssue]
+    assert first.open is second.open  # pyright: ignore [reportAttributeAccessIssue]
+
+    with pytest.raises(ValueError):
+        DrawerRoot.create(direction="diagonal")  # pyright: ignore [reportArgumentType]
@@ -9,7 +9,7 @@ from pandas import DataFrame
 import reflex as rx
 from reflex.base import Base
 from reflex.constants.base import REFLEX_VAR_CLOSING_TAG, REFLEX_VAR_OPENING_TAG
-from reflex.state import BaseState
+from reflex.state import BaseState, MutableProxy
 from reflex.utils.exceptions import (
     PrimitiveUnserializableToJSONError,
     UntypedComputedVarError,
@@ -27,6 +27,7 @@ from reflex.vars.base import (
 from reflex.vars.function import (
     ArgsFunctionOperation,
     DestructuredArg,
+    FunctionArgs,
     FunctionStringVar,
 )
 from reflex.vars.number import LiteralBooleanVar, LiteralNumberVar, NumberVar
@@ -911,6 +912,45 @@ def test_literal_var():
     )
 
 
+def test_literal_var_create_after_abc_registration():
+    """Test that a type registered with an ABC later on is still converted."""
+
+    class CustomMapping:
+        def __getitem__(self, key):
+            return {"a": 1}[key]
+
+        def __iter__(self):
+            return iter(["a"])
+
+        def __len__(self):
+            return 1
+
+        def keys(self):
+            return ["a"]
+
+        def values(self):
+            return [1]
+
+        def items(self):
+            return [("a", 1)]
+
+    with pytest.raises(TypeError):
+        LiteralVar.create(CustomMapping())
+
+    Mapping.register(CustomMapping)  # pyright: ignore [reportAttributeAccessIssue]
+    assert str(LiteralVar.create(CustomMapping())) == '({ ["a"] : 1 })'
+
+
+def test_literal_var_create_proxied_values():
+    """Test that proxied values are converted based on the wrapped value."""
+    state = ATestState(value="")
+    list_proxy = MutableProxy([1, 2], state, "dict_val")
+    dict_proxy = MutableProxy({"a": 1}, state, "dict_val")
+
+    assert str(LiteralVar.create(list_proxy)) == "[1, 2]"
+    assert str(LiteralVar.create(dict_proxy)) == '({ ["a"] : 1 })'
+
+
 def test_function_var():
     addition_func = FunctionStringVar.create("((a, b) => a + b)")
     assert str(addition_func.call(1, 2)) == "(((a, b) => a + b)(1, 2))"
@@ -960,6 +1000,19 @@ def test_function_var():
     assert str(explicit_return_func.call(1, 2)) == "(((a, b) => {return a + b})(1, 2))"
 
 
+def test_function_args_to_javascript():
+    args = FunctionArgs(
+        args=("a", DestructuredArg(fields=("b", "c"), rest="d")), rest="e"
+    )
+    assert args.to_javascript() == "a, {b, c, ...d}, ...e"
+    assert FunctionArgs(rest="e").to_javascript() == "...e"
+    # The formatted arguments are cached, but do not affect equality.
+    assert args.to_javascript() is args.to_javascript()
+    assert args == FunctionArgs(
+        args=("a", DestructuredArg(fields=("b", "c"), rest="d")), rest="e"
+    )
+
+
 def test_var_operation():
     @var_operation
     def add(a: Union[NumberVar, int], b: Union[NumberVar, int]):
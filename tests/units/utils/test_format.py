@@ -349,6 +349,18 @@ def test_format_match(
     assert format.format_match(condition, match_cases, default) == expected
 
 
+def test_format_match_lookup():
+    """Test formatting a match statement as an object lookup."""
+    assert (
+        format.format_match_lookup(
+            "state__state.value",
+            [("1", LiteralVar.create("red")), ('"blue"', LiteralVar.create("blue"))],
+            LiteralVar.create("yellow"),
+        )
+        == '({"1": ("red"), "\\"blue\\"": ("blue")}[JSON.stringify(state__state.value)] ?? ("yellow"))'
+    )
+
+
 @pytest.mark.parametrize(
     "prop,formatted",
     [
@@ -1,5 +1,6 @@
 import pytest
 
+from reflex.constants.compiler import Imports
 from reflex.utils.imports import (
     ImportDict,
     ImportVar,
@@ -7,6 +8,7 @@ from reflex.utils.imports import (
     merge_imports,
     parse_imports,
 )
+from reflex.vars import VarData
 
 
 @pytest.mark.parametrize(
@@ -115,3 +117,20 @@ def test_merge_imports(input_1, input_2, output):
 )
 def test_parse_imports(input: ImportDict, output: ParsedImportDict):
     assert parse_imports(input) == output
+
+
+def test_events_imports_mapping():
+    """Test that the shared event imports can be used like any import dict."""
+    parsed = parse_imports(Imports.EVENTS)
+    assert parsed == {lib: list(fields) for lib, fields in Imports.EVENTS.items()}
+
+    merged = {**Imports.EVENTS, "react-dropzone": "useDropzone"}
+    assert merged["react"] == Imports.EVENTS["react"]
+
+    var_data = VarData(imports=Imports.EVENTS)
+    assert var_data.imports == tuple(
+        (lib, fields) for lib, fields in Imports.EVENTS.items()
+    )
+
+    with pytest.raises(TypeError):
+        Imports.EVENTS["react"] = (ImportVar(tag="useState"),)  # pyright: ignore [reportIndexIssue]